@@ -4,439 +4,495 @@ Bulk issue creation script for CMBurnett/con-ai repository
 Creates all 13 issues with proper milestones and labels
 """
 
-import subprocess
+import email.utils
+import http.client
 import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import threading
 import time
-
-# Issue definitions
-issues = [
-    {
-        "title": "FastAPI Backend Setup",
-        "milestone": "Core Infrastructure",
-        "labels": ["backend", "infrastructure", "priority:high"],
-        "body": """## Description
-Set up FastAPI backend with WebSocket support for real-time agent communication.
-
-## ClaudeCode Implementation Notes
-- [ ] Database changes needed: SQLAlchemy models for agents, tasks, and results
-- [ ] API endpoints required: /agents, /tasks, /ws websocket endpoint
-- [ ] Frontend components needed: None (backend only)
-- [ ] Tests to write: WebSocket connection tests, API endpoint tests, database model tests
-
-## Acceptance Criteria
-- [ ] FastAPI app with CORS configuration
-- [ ] WebSocket endpoint for real-time updates
-- [ ] Basic API endpoints for agent management
-- [ ] SQLite database integration
-- [ ] Environment configuration management
-- [ ] Basic error handling and logging
-
-**Tasks:**
-- Set up FastAPI project structure
-- Implement WebSocket handler
-- Create database models with SQLAlchemy
-- Add configuration management
-- Write basic tests
-
-**Estimate:** 3 days"""
-    },
-    {
-        "title": "React PWA Frontend Foundation",
-        "milestone": "Core Infrastructure",
-        "labels": ["frontend", "infrastructure", "priority:high"],
-        "body": """## Description
-Create React PWA with TypeScript, real-time WebSocket integration, and basic UI components.
-
-## ClaudeCode Implementation Notes
-- [ ] Database changes needed: None (frontend only)
-- [ ] API endpoints required: None (consumes existing WebSocket)
-- [ ] Frontend components needed: AgentDashboard, WebSocket hook, routing, state management
-- [ ] Tests to write: Component tests, WebSocket hook tests, integration tests
-
-## Acceptance Criteria
-- [ ] React app with TypeScript and PWA manifest
-- [ ] WebSocket hook for real-time communication
-- [ ] Basic routing and navigation
-- [ ] Agent dashboard component
-- [ ] State management with Zustand
-- [ ] Responsive design with Tailwind CSS
-
-**Tasks:**
-- Initialize React app with PWA template
-- Set up TypeScript and development tools
-- Implement WebSocket custom hook
-- Create basic component structure
-- Add state management
-
-**Estimate:** 4 days"""
-    },
-    {
-        "title": "Agent Framework Architecture",
-        "milestone": "Core Infrastructure",
-        "labels": ["backend", "agents", "priority:high"],
-        "body": """## Description
-Build base agent architecture with browser-use integration and common functionality.
-
-## ClaudeCode Implementation Notes
-- [ ] Database changes needed: Agent configuration tables, execution logs
-- [ ] API endpoints required: /agents/start, /agents/stop, /agents/status
-- [ ] Frontend components needed: None (backend framework)
-- [ ] Tests to write: BaseAgent tests, browser-use integration tests, agent manager tests
-
-## Acceptance Criteria
-- [ ] BaseAgent abstract class
-- [ ] Browser-use library integration
-- [ ] Agent lifecycle management
-- [ ] Progress tracking and status updates
-- [ ] Error handling and recovery
-- [ ] Configuration management
-
-**Tasks:**
-- Design BaseAgent interface
-- Integrate browser-use library
-- Implement agent manager service
-- Add progress tracking
-- Create demo "hello world" agent
-
-**Estimate:** 3 days"""
-    },
-    {
-        "title": "Demo Agent Implementation",
-        "milestone": "Core Infrastructure",
-        "labels": ["backend", "agents"],
-        "body": """## Description
-Create a simple demo agent that navigates to a website and extracts basic information.
-
-## ClaudeCode Implementation Notes
-- [ ] Database changes needed: Demo agent results table
-- [ ] API endpoints required: None (uses existing agent framework)
-- [ ] Frontend components needed: Demo agent tile in dashboard
-- [ ] Tests to write: Demo agent execution tests, data extraction validation
-
-## Acceptance Criteria
-- [ ] Demo agent extends BaseAgent
-- [ ] Successfully navigates to test website
-- [ ] Extracts and returns structured data
-- [ ] Sends real-time progress updates
-- [ ] Handles basic error scenarios
-
-**Tasks:**
-- Implement demo agent class
-- Test browser automation workflow
-- Add progress reporting
-- Test error scenarios
-
-**Estimate:** 2 days"""
-    },
-    {
-        "title": "Procore Agent Development",
-        "milestone": "First Construction Integration",
-        "labels": ["backend", "agents", "priority:high"],
-        "body": """## Description
-Develop Procore agent for extracting project data, RFIs, and budget information.
-
-## ClaudeCode Implementation Notes
-- [ ] Database changes needed: Procore project data tables, RFI tracking, budget variance storage
-- [ ] API endpoints required: /agents/procore/configure, /procore/projects, /procore/rfis
-- [ ] Frontend components needed: Procore configuration form, project data visualization
-- [ ] Tests to write: Procore login tests, data extraction validation, error handling tests
-
-## Acceptance Criteria
-- [ ] Procore login automation
-- [ ] Project data extraction
-- [ ] RFI status and details retrieval
-- [ ] Budget vs actual cost tracking
-- [ ] Schedule milestone extraction
-- [ ] Data validation and error handling
-
-**Tasks:**
-- Research Procore UI navigation patterns
-- Implement login automation
-- Build data extraction workflows
-- Add data validation
-- Test with multiple Procore instances
-
-**Estimate:** 5 days"""
-    },
-    {
-        "title": "Data Visualization Dashboard",
-        "milestone": "First Construction Integration",
-        "labels": ["frontend", "priority:medium"],
-        "body": """## Description
-Create dashboard components to visualize extracted construction data.
-
-## ClaudeCode Implementation Notes
-- [ ] Database changes needed: None (reads existing agent data)
-- [ ] API endpoints required: /dashboard/data, /export/csv, /export/pdf
-- [ ] Frontend components needed: Chart components, data filters, export buttons, real-time updates
-- [ ] Tests to write: Chart rendering tests, data filtering tests, export functionality tests
-
-## Acceptance Criteria
-- [ ] Project overview cards
-- [ ] RFI status charts
-- [ ] Budget variance visualizations
-- [ ] Schedule progress indicators
-- [ ] Real-time data updates
-- [ ] Export functionality
-
-**Tasks:**
-- Design dashboard layout
-- Implement chart components with Recharts
-- Add data filtering and sorting
-- Create export functionality
-- Test with Procore data
-
-**Estimate:** 4 days"""
-    },
-    {
-        "title": "Autodesk Construction Cloud Agent",
-        "milestone": "Multi-Agent Orchestration",
-        "labels": ["backend", "agents", "priority:high"],
-        "body": """## Description
-Develop agent for Autodesk Construction Cloud data extraction and BIM integration.
-
-## ClaudeCode Implementation Notes
-- [ ] Database changes needed: ACC project tables, BIM model metadata, issue tracking
-- [ ] API endpoints required: /agents/autodesk/configure, /autodesk/projects, /autodesk/models
-- [ ] Frontend components needed: Autodesk configuration form, BIM data visualization
-- [ ] Tests to write: ACC login tests, BIM data extraction, cross-platform correlation tests
-
-## Acceptance Criteria
-- [ ] ACC login and navigation
-- [ ] Project and model data extraction
-- [ ] Issue and RFI synchronization
-- [ ] Document management integration
-- [ ] Progress tracking with BIM data
-
-**Tasks:**
-- Map ACC UI navigation flows
-- Implement data extraction workflows
-- Add BIM-specific data handling
-- Test cross-platform data correlation
-
-**Estimate:** 4 days"""
-    },
-    {
-        "title": "Oracle Primavera Agent",
-        "milestone": "Multi-Agent Orchestration",
-        "labels": ["backend", "agents", "priority:medium"],
-        "body": """## Description
-Build agent for Oracle Primavera P6 schedule and resource data extraction.
-
-## ClaudeCode Implementation Notes
-- [ ] Database changes needed: P6 schedule tables, resource allocation data, critical path analysis
-- [ ] API endpoints required: /agents/primavera/configure, /primavera/schedules, /primavera/resources
-- [ ] Frontend components needed: Primavera configuration form, schedule visualization, resource charts
-- [ ] Tests to write: P6 login tests, schedule extraction validation, resource tracking tests
-
-## Acceptance Criteria
-- [ ] P6 web interface automation
-- [ ] Schedule data extraction
-- [ ] Resource allocation tracking
-- [ ] Critical path analysis
-- [ ] Progress measurement
-- [ ] Integration with other agents
-
-**Tasks:**
-- Research P6 web interface patterns
-- Implement schedule extraction
-- Add resource tracking
-- Build cross-platform correlation
-
-**Estimate:** 5 days"""
-    },
-    {
-        "title": "Multi-Agent Coordination System",
-        "milestone": "Multi-Agent Orchestration",
-        "labels": ["backend", "priority:high"],
-        "body": """## Description
-Build system for coordinating multiple agents and correlating data across platforms.
-
-## ClaudeCode Implementation Notes
-- [ ] Database changes needed: Agent coordination tables, scheduling queue, data correlation mappings
-- [ ] API endpoints required: /orchestration/schedule, /orchestration/status, /correlation/sync
-- [ ] Frontend components needed: Agent coordination dashboard, scheduling interface, conflict resolution UI
-- [ ] Tests to write: Multi-agent coordination tests, data correlation validation, conflict resolution tests
-
-## Acceptance Criteria
-- [ ] Agent scheduling and queuing
-- [ ] Data correlation between platforms
-- [ ] Conflict detection and resolution
-- [ ] Batch processing capabilities
-- [ ] Performance monitoring
-
-**Tasks:**
-- Design agent coordination workflows
-- Implement data correlation logic
-- Add scheduling system
-- Build monitoring dashboard
-
-**Estimate:** 4 days"""
-    },
-    {
-        "title": "PyInstaller Distribution Package",
-        "milestone": "Production-Ready Package",
-        "labels": ["backend", "priority:high"],
-        "body": """## Description
-Create distributable package using PyInstaller for easy user installation.
-
-## ClaudeCode Implementation Notes
-- [ ] Database changes needed: None (packaging only)
-- [ ] API endpoints required: None (packaging only)
-- [ ] Frontend components needed: None (packaging only)
-- [ ] Tests to write: Installation tests, cross-platform compatibility tests, auto-updater tests
-
-## Acceptance Criteria
-- [ ] Single executable creation
-- [ ] Frontend assets bundled correctly
-- [ ] Python dependencies included
-- [ ] Cross-platform compatibility (Windows/macOS)
-- [ ] Installation wizard/script
-- [ ] Auto-updater integration
-
-**Tasks:**
-- Configure PyInstaller specifications
-- Bundle React build assets
-- Test on multiple platforms
-- Create installation scripts
-- Add auto-update mechanism
-
-**Estimate:** 3 days"""
-    },
-    {
-        "title": "User Onboarding System",
-        "milestone": "Production-Ready Package",
-        "labels": ["frontend", "priority:medium"],
-        "body": """## Description
-Build guided onboarding flow for new users to configure their first agents.
-
-## ClaudeCode Implementation Notes
-- [ ] Database changes needed: User onboarding progress tracking, configuration templates
-- [ ] API endpoints required: /onboarding/progress, /onboarding/complete, /templates/agent
-- [ ] Frontend components needed: Welcome wizard, step-by-step forms, progress indicators, help tooltips
-- [ ] Tests to write: Onboarding flow tests, wizard navigation tests, configuration validation tests
-
-## Acceptance Criteria
-- [ ] Welcome screen and tutorial
-- [ ] Software connection wizard
-- [ ] Agent configuration guidance
-- [ ] Test agent execution
-- [ ] Help documentation integration
-
-**Tasks:**
-- Design onboarding flow
-- Create step-by-step wizard components
-- Add help system
-- Test user experience
-
-**Estimate:** 3 days"""
-    },
-    {
-        "title": "Documentation and Help System",
-        "milestone": "Production-Ready Package",
-        "labels": ["priority:medium"],
-        "body": """## Description
-Create comprehensive documentation for users and developers.
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+REPO = "CMBurnett/con-ai"
+API_HOST = "api.github.com"
+MAX_WORKERS = 4
+# Seconds before a stalled connection gives up instead of hanging a worker
+REQUEST_TIMEOUT = 30
+# GitHub's secondary limits cap content creation at 80 requests/min; stay well under
+ISSUES_PER_MINUTE = 60
+MAX_RETRIES = 4
+SECONDARY_LIMIT_WAIT = 60
+# Pause until the quota resets once fewer than this many requests remain
+RATE_LIMIT_FLOOR = 5
+
+_print_lock = threading.Lock()
+
+ISSUES_FILE = Path(__file__).with_name("issues.json")
+# Local record of issues this script has created, checked before any network call
+LEDGER_FILE = Path(__file__).with_name(".created_issues.json")
+_issues_cache = None
+
+BODY_TEMPLATE = """## Description
+{description}
 
 ## ClaudeCode Implementation Notes
-- [ ] Database changes needed: None (documentation only)
-- [ ] API endpoints required: None (documentation only)
-- [ ] Frontend components needed: In-app help system, documentation viewer
-- [ ] Tests to write: Documentation completeness tests, help system navigation tests
+- [ ] Database changes needed: {database}
+- [ ] API endpoints required: {api}
+- [ ] Frontend components needed: {frontend}
+- [ ] Tests to write: {tests}
 
 ## Acceptance Criteria
-- [ ] User installation guide
-- [ ] Agent configuration documentation
-- [ ] Troubleshooting guide
-- [ ] Developer API documentation
-- [ ] Video tutorials (optional)
+{acceptance_criteria}
 
 **Tasks:**
-- Write user documentation
-- Create developer guides
-- Add in-app help system
-- Record demonstration videos
-
-**Estimate:** 2 days"""
-    },
-    {
-        "title": "Beta Testing Framework",
-        "milestone": "Production-Ready Package",
-        "labels": ["backend", "priority:medium"],
-        "body": """## Description
-Set up beta testing program with feedback collection and analytics.
-
-## ClaudeCode Implementation Notes
-- [ ] Database changes needed: Beta user tracking, usage analytics, feedback storage
-- [ ] API endpoints required: /analytics/track, /feedback/submit, /beta/users
-- [ ] Frontend components needed: Feedback forms, analytics dashboard, beta user portal
-- [ ] Tests to write: Analytics tracking tests, feedback submission tests, user management tests
-
-## Acceptance Criteria
-- [ ] Beta user management system
-- [ ] Usage analytics collection
-- [ ] Feedback submission system
-- [ ] Error reporting and logging
-- [ ] Performance monitoring
-
-**Tasks:**
-- Implement analytics tracking
-- Create feedback forms
-- Set up error reporting
-- Build beta user portal
+{tasks}
+
+**Estimate:** {estimate}"""
+
+def render_body(issue):
+    """Fill BODY_TEMPLATE from an issue's structured fields"""
+    return BODY_TEMPLATE.format_map({
+        "description": issue["description"],
+        **issue["implementation_notes"],
+        "acceptance_criteria": "\n".join(f"- [ ] {item}" for item in issue["acceptance_criteria"]),
+        "tasks": "\n".join(f"- {task}" for task in issue["tasks"]),
+        "estimate": issue["estimate"],
+    })
+
+def load_issues():
+    """Load issue definitions from issues.json, parsing the file only once"""
+    global _issues_cache
+    if _issues_cache is None:
+        with open(ISSUES_FILE, encoding="utf-8") as f:
+            issues = json.load(f)
+        # json.load allocates a fresh str per occurrence; share the repeated labels/milestones
+        for issue in issues:
+            issue["body"] = render_body(issue)
+            issue["milestone"] = sys.intern(issue["milestone"])
+            issue["labels"] = [sys.intern(label) for label in issue["labels"]]
+        _issues_cache = issues
+    return _issues_cache
+
+def load_ledger():
+    """Return {title: {"number", "url"}} for issues recorded by previous runs"""
+    if not LEDGER_FILE.exists():
+        return {}
+    with open(LEDGER_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+def save_ledger(ledger):
+    with open(LEDGER_FILE, "w", encoding="utf-8") as f:
+        json.dump(ledger, f, indent=2, ensure_ascii=False)
+
+def record_created(ledger, records):
+    """Add created issue records to the ledger and persist it"""
+    if not records:
+        return
+    for record in records:
+        ledger[record["title"]] = {"number": record["number"], "url": record["url"]}
+    save_ledger(ledger)
+
+def get_token():
+    """Return a GitHub token from the environment, falling back to gh's stored login
+
+    gh is looked up on PATH once; without it the script needs GH_TOKEN/GITHUB_TOKEN
+    and never attempts to spawn a subprocess.
+    """
+    for var in ("GH_TOKEN", "GITHUB_TOKEN"):
+        token = os.environ.get(var)
+        if token:
+            print(f"Using token from {var}")
+            return token
+    gh_path = shutil.which("gh")
+    if gh_path is None:
+        sys.exit("❌ No GitHub token: set GH_TOKEN or GITHUB_TOKEN, or install and log in to gh")
+    # close_fds=False plus an absolute executable path lets CPython < 3.13 use
+    # posix_spawn() instead of fork()+exec()
+    result = subprocess.run(
+        [gh_path, "auth", "token"], capture_output=True, text=True, close_fds=False
+    )
+    if result.returncode != 0:
+        sys.exit(f"❌ Could not read token from gh: {result.stderr.strip()}")
+    print("Using token from gh auth")
+    return result.stdout.strip()
+
+class RateLimiter:
+    """Thread-safe token bucket: allows a burst of `capacity`, then `per_min` calls/minute"""
+
+    def __init__(self, per_min, capacity):
+        self.rate = per_min / 60.0
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            # Negative balance reserves a future slot for this caller
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+def parse_retry_after(value):
+    """Seconds from a Retry-After header (delta-seconds or HTTP-date), or None if unparseable"""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+def retry_delay(status, headers, data, attempt):
+    """Seconds to wait before retrying a rate-limited response, or None if not rate limited"""
+    retry_after = headers.get("Retry-After")
+    message = data.get("message", "") if isinstance(data, dict) else str(data or "")
+    # Secondary-limit 403s may carry no rate-limit headers at all, only this message
+    secondary = status == 403 and "secondary rate limit" in message.lower()
+    rate_limited = status == 429 or secondary or (
+        status == 403 and (retry_after is not None or headers.get("X-RateLimit-Remaining") == "0")
+    )
+    if not rate_limited:
+        return None
+    delay = parse_retry_after(retry_after) if retry_after is not None else None
+    reset = headers.get("X-RateLimit-Reset")
+    if delay is None and headers.get("X-RateLimit-Remaining") == "0" and reset is not None:
+        try:
+            delay = max(0.0, int(reset) - time.time()) + 1
+        except ValueError:
+            pass
+    if delay is None:
+        delay = 2 ** attempt + random.random()
+    # GitHub asks clients to wait at least a minute after a secondary-limit response
+    return max(delay, SECONDARY_LIMIT_WAIT) if secondary else delay
+
+def quota_pause(headers):
+    """Seconds to wait so the next request doesn't exhaust the primary rate limit"""
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is None or reset is None or int(remaining) >= RATE_LIMIT_FLOOR:
+        return 0.0
+    return max(0.0, int(reset) - time.time())
+
+class GitHubClient:
+    """Minimal REST client that reuses one keep-alive HTTPS connection per thread"""
+
+    def __init__(self, token):
+        self.headers = {
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "con-ai-create-issues",
+            "Content-Type": "application/json",
+        }
+        self.local = threading.local()
+        self.conns = []
+        self.conns_lock = threading.Lock()
+
+    @property
+    def conn(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = self.local.conn = http.client.HTTPSConnection(API_HOST, timeout=REQUEST_TIMEOUT)
+            with self.conns_lock:
+                self.conns.append(conn)
+        return conn
+
+    def _send(self, method, path, body):
+        """Return (status, headers, data); status 0 means no response was received
+
+        A request is only resent when it can't have reached GitHub (the send itself
+        failed) or is a read. A POST that loses its response is reported as failed
+        rather than replayed, since GitHub may already have applied it.
+        """
+        conn = self.conn
+        try:
+            try:
+                conn.request(method, path, body=body, headers=self.headers)
+            except OSError:
+                # Stale keep-alive connection; the request never went out in full
+                conn.close()
+                conn.request(method, path, body=body, headers=self.headers)
+            try:
+                resp = conn.getresponse()
+            except http.client.RemoteDisconnected:
+                if method != "GET":
+                    raise
+                # Server dropped the idle keep-alive connection; replaying a read is safe
+                conn.close()
+                conn.request(method, path, body=body, headers=self.headers)
+                resp = conn.getresponse()
+            raw = resp.read()
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            return 0, {}, f"No response from GitHub ({e!r}); the request may still have been applied"
+        try:
+            data = json.loads(raw) if raw else None
+        except ValueError:
+            # 5xx error pages are often HTML; hand back the text for the error message
+            data = raw.decode("utf-8", "replace")
+        return resp.status, resp.headers, data
+
+    def request(self, method, path, payload=None):
+        """Send a request; `payload` may be a JSON-serializable object or pre-encoded bytes
+
+        Rate-limited responses (429, or 403 with rate-limit headers) are retried with
+        the delay GitHub asks for, or exponential backoff when it gives none.
+        """
+        if payload is None or isinstance(payload, bytes):
+            body = payload
+        else:
+            body = json.dumps(payload).encode("utf-8")
+        for attempt in range(MAX_RETRIES + 1):
+            status, headers, data = self._send(method, path, body)
+            delay = retry_delay(status, headers, data, attempt)
+            if delay is None or attempt == MAX_RETRIES:
+                pause = quota_pause(headers)
+                if pause > 0:
+                    with _print_lock:
+                        print(f"⏳ Rate limit nearly exhausted, waiting {pause:.0f}s for reset...")
+                    time.sleep(pause)
+                return status, data
+            with _print_lock:
+                print(f"⏳ Rate limited ({status}), retrying in {delay:.0f}s...")
+            time.sleep(delay)
+
+    def graphql(self, query, variables=None):
+        status, data = self.request("POST", "/graphql", {"query": query, "variables": variables or {}})
+        if status != 200 or not isinstance(data, dict):
+            raise RuntimeError(f"GraphQL request failed ({status}): {data}")
+        return data
+
+    def close(self):
+        with self.conns_lock:
+            for conn in self.conns:
+                conn.close()
+            self.conns.clear()
+
+REPO_METADATA_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    id
+    labels(first: 100) { nodes { id name } }
+    milestones(first: 100) { nodes { id number title } }
+  }
+}
+"""
 
-**Estimate:** 2 days"""
+def get_repo_metadata(client):
+    """Fetch the repository node ID plus label and milestone IDs in one query"""
+    owner, name = REPO.split("/")
+    data = client.graphql(REPO_METADATA_QUERY, {"owner": owner, "name": name})
+    repo = (data.get("data") or {}).get("repository")
+    if repo is None:
+        raise RuntimeError(f"Failed to load repository metadata: {data.get('errors')}")
+    return {
+        "id": repo["id"],
+        "labels": {label["name"]: label["id"] for label in repo["labels"]["nodes"]},
+        "milestones": {m["title"]: m for m in repo["milestones"]["nodes"]},
     }
-]
 
-def create_issue(issue_data):
-    """Create a single issue using GitHub CLI"""
-    labels_str = ",".join(issue_data["labels"])
+def get_existing_titles(client):
+    """Collect titles of all issues (not pull requests) already in the repo, paging through results"""
+    titles = set()
+    page = 1
+    while True:
+        status, data = client.request(
+            "GET", f"/repos/{REPO}/issues?state=all&per_page=100&page={page}"
+        )
+        if status != 200:
+            raise RuntimeError(f"Failed to list issues ({status}): {data}")
+        # The issues endpoint also lists pull requests; only real issues count
+        titles.update(issue["title"] for issue in data if "pull_request" not in issue)
+        if len(data) < 100:
+            return titles
+        page += 1
+
+def create_issues_batch(client, pending, metadata):
+    """Create issues with one aliased GraphQL mutation
+
+    Returns (created, leftover): records for the issues created and the issue
+    definitions left uncreated. If any batched issue comes back without a result, the
+    repo is re-listed and issues that were created anyway are dropped from leftover
+    (without records).
+
+    Issues referencing labels or milestones missing from the repo are left for the
+    REST path, which creates labels on demand.
+    """
+    batch = []
+    leftover = []
+    for issue in pending:
+        label_ids = [metadata["labels"].get(label) for label in issue["labels"]]
+        milestone = metadata["milestones"].get(issue["milestone"])
+        if milestone is None or None in label_ids:
+            leftover.append(issue)
+        else:
+            batch.append((issue, {
+                "repositoryId": metadata["id"],
+                "title": issue["title"],
+                "body": issue["body"],
+                "labelIds": label_ids,
+                "milestoneId": milestone["id"],
+            }))
+    if not batch:
+        return [], leftover
     
-    cmd = [
-        "gh", "issue", "create",
-        "--repo", "CMBurnett/con-ai",
-        "--title", issue_data["title"],
-        "--body", issue_data["body"],
-        "--milestone", issue_data["milestone"],
-        "--label", labels_str
-    ]
+    params = ", ".join(f"$i{n}: CreateIssueInput!" for n in range(len(batch)))
+    fields = "\n".join(
+        f"  i{n}: createIssue(input: $i{n}) {{ issue {{ number url }} }}" for n in range(len(batch))
+    )
+    query = f"mutation({params}) {{\n{fields}\n}}"
+    variables = {f"i{n}": issue_input for n, (_, issue_input) in enumerate(batch)}
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        print(f"✅ Created: {issue_data['title']}")
-        print(f"   URL: {result.stdout.strip()}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to create: {issue_data['title']}")
-        print(f"   Error: {e.stderr}")
-        return False
+        response = client.graphql(query, variables)
+    except RuntimeError as e:
+        print(f"⚠️  Batch creation failed: {e}")
+        response = {}
+    if response.get("errors"):
+        error = response["errors"][0]
+        print(f"⚠️  Batch reported errors: {error.get('message') or error}")
+    data = response.get("data") or {}
+    
+    created = []
+    uncreated = []
+    for n, (issue, _) in enumerate(batch):
+        result = data.get(f"i{n}")
+        if result and result.get("issue"):
+            record = {"title": issue["title"], **result["issue"]}
+            print(f"✅ Created: {record['title']}\n   URL: {record['url']}")
+            created.append(record)
+        else:
+            uncreated.append(issue)
+    
+    if uncreated:
+        # Neither a failed request nor an error in the response (GraphQL timeouts come
+        # back as 200 with "data": null) proves the remaining mutations didn't run,
+        # so only fall back for issues that still don't exist
+        print(f"⚠️  Re-checking {len(uncreated)} issue(s) before falling back to REST")
+        existing = get_existing_titles(client)
+        for issue in uncreated:
+            if issue["title"] in existing:
+                print(f"✅ Created (confirmed after batch error): {issue['title']}")
+            else:
+                leftover.append(issue)
+    return created, leftover
+
+def prepare_rest_requests(issues, milestones):
+    """Encode each issue's REST payload once, ahead of the worker pool
+
+    Returns (prepared, failed): issues whose milestone doesn't exist in the repo are
+    reported as failures and not posted, since reruns would never add the milestone.
+    """
+    prepared = []
+    failed = 0
+    for issue in issues:
+        milestone = milestones.get(issue["milestone"])
+        if milestone is None:
+            print(f"❌ Failed to create: {issue['title']}")
+            print(f"   Error: milestone not found: {issue['milestone']}")
+            failed += 1
+            continue
+        payload = {
+            "title": issue["title"],
+            "body": issue["body"],
+            "labels": issue["labels"],
+            "milestone": milestone["number"],
+        }
+        prepared.append((issue["title"], json.dumps(payload).encode("utf-8")))
+    return prepared, failed
+
+def create_issue(client, title, payload, limiter):
+    """Create a single issue using the GitHub REST API; return its record or None"""
+    limiter.acquire()
+    status, data = client.request("POST", f"/repos/{REPO}/issues", payload)
+    if status == 201:
+        record = {"title": title, "number": data["number"], "url": data["html_url"]}
+        message = f"✅ Created: {title}\n   URL: {record['url']}"
+    else:
+        record = None
+        message = f"❌ Failed to create: {title}\n   Error ({status}): {data}"
+    # Hold the lock so worker output doesn't interleave
+    with _print_lock:
+        print(message)
+    return record
 
 def main():
     """Create all issues"""
-    print(f"Creating {len(issues)} issues for CMBurnett/con-ai...")
+    issues = load_issues()
+    print(f"Creating {len(issues)} issues for {REPO}...")
     print("=" * 50)
     
-    successful = 0
-    failed = 0
+    ledger = load_ledger()
+    unrecorded = []
+    for issue in issues:
+        if issue["title"] in ledger:
+            print(f"⏭️  Skipped (created previously): {issue['title']}")
+        else:
+            unrecorded.append(issue)
     
-    for i, issue in enumerate(issues, 1):
-        print(f"\n[{i}/{len(issues)}] Creating issue...")
+    pending = []
+    failed = 0
+    if unrecorded:
+        client = GitHubClient(get_token())
+        limiter = RateLimiter(ISSUES_PER_MINUTE, MAX_WORKERS)
+        rest_created = []
         
-        if create_issue(issue):
-            successful += 1
-        else:
-            failed += 1
+        try:
+            metadata = get_repo_metadata(client)
+            existing = get_existing_titles(client)
+            for issue in unrecorded:
+                if issue["title"] in existing:
+                    print(f"⏭️  Skipped (already exists): {issue['title']}")
+                else:
+                    pending.append(issue)
             
-        # Small delay to avoid rate limiting
-        time.sleep(1)
+            created, leftover = create_issues_batch(client, pending, metadata) if pending else ([], [])
+            # Persist right away so a later failure can't lose these records
+            record_created(ledger, created)
+            
+            # Anything the batch couldn't create is retried one issue at a time over REST
+            prepared, failed = prepare_rest_requests(leftover, metadata["milestones"])
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                futures = [
+                    executor.submit(create_issue, client, *request, limiter) for request in prepared
+                ]
+                error = None
+                for future in as_completed(futures):
+                    try:
+                        record = future.result()
+                    except Exception as e:
+                        # Keep collecting so other workers' issues still reach the ledger
+                        error = error or e
+                        record = None
+                    if record is None:
+                        failed += 1
+                    else:
+                        rest_created.append(record)
+                if error is not None:
+                    raise error
+        finally:
+            client.close()
+            record_created(ledger, rest_created)
+    
+    skipped = len(issues) - len(pending)
+    successful = len(pending) - failed
     
     print("\n" + "=" * 50)
-    print(f"Summary: {successful} created, {failed} failed")
+    print(f"Summary: {successful} created, {skipped} skipped, {failed} failed")
     
     if failed > 0:
         print("\nIf any issues failed, you can run this script again")
         print("It will only create issues that don't already exist")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()